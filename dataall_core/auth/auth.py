@@ -2,14 +2,17 @@
 
 import getpass
 import logging
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, cast
 
 from dataall_core.profile import ConfigType, Profile
 
 logger = logging.getLogger(__name__)
 
+TOKEN_EXPIRY_SKEW = timedelta(seconds=60)
+
 
 class AuthorizationClass(ABC):
     """data.all client class to handle authentication and retrieval of JWT token.
@@ -27,35 +30,55 @@ class AuthorizationClass(ABC):
         :param profile:
         """
         self.profile = cast(Profile, profile)
+        self._refresh_lock = threading.Lock()
 
     def get_jwt_token(self) -> str:
         """Retrieve save token from config file and if expired generate new token using the refresh token.
 
         :return: JWT token
         """
-        if (
-            self.profile.credentials.token is None
-            or self.profile.credentials.expires_at is None
-            or datetime.now()
-            > datetime.fromisoformat(self.profile.credentials.expires_at)
-        ):
-            refresh_successful = False
-            if self.profile.credentials.refresh_token:
-                refresh_successful = self._refresh_and_get_token()
-
-            if not refresh_successful:
-                logger.info("Failed to refresh token. Authenticating...")
-                username = self.profile.username
-                password = self.profile.password
-                if not username or self.profile.config_type == ConfigType.LOCAL.value:
-                    username = input("Provide your data.all username: ")
-                if not password or self.profile.config_type == ConfigType.LOCAL.value:
-                    password = getpass.getpass(
-                        prompt="Provide your data.all password: "
-                    )
-                self._authenticate_and_get_token(username, password)
+        if not self._is_token_valid():
+            with self._refresh_lock:
+                # Another thread may have refreshed the token while waiting on the lock
+                if not self._is_token_valid():
+                    # Another process may have persisted a fresh token since the profile was loaded
+                    self.profile.get_credentials()
+
+                if not self._is_token_valid():
+                    self._refresh_or_authenticate()
         return cast(str, self.profile.credentials.token)
 
+    def _refresh_or_authenticate(self) -> None:
+        """Refresh the token if possible, otherwise authenticate with username and password.
+
+        :return: None
+        """
+        refresh_successful = False
+        if self.profile.credentials.refresh_token:
+            refresh_successful = self._refresh_and_get_token()
+
+        if not refresh_successful:
+            logger.info("Failed to refresh token. Authenticating...")
+            username = self.profile.username
+            password = self.profile.password
+            if not username or self.profile.config_type == ConfigType.LOCAL.value:
+                username = input("Provide your data.all username: ")
+            if not password or self.profile.config_type == ConfigType.LOCAL.value:
+                password = getpass.getpass(prompt="Provide your data.all password: ")
+            self._authenticate_and_get_token(username, password)
+
+    def _is_token_valid(self) -> bool:
+        """Check if the profile token is set and not about to expire.
+
+        :return: True if the token can be used, False otherwise
+        """
+        return (
+            self.profile.credentials.token is not None
+            and self.profile.credentials.expires_at is not None
+            and datetime.now() + TOKEN_EXPIRY_SKEW
+            < datetime.fromisoformat(self.profile.credentials.expires_at)
+        )
+
     @abstractmethod
     def _refresh_and_get_token(self) -> bool:
         """Refresh the token using the refresh token.
@@ -7,7 +7,7 @@ import logging
 import secrets
 import urllib.parse
 from datetime import datetime, timedelta
-from typing import Any, Optional, Tuple, cast
+from typing import Any, Dict, Optional, Tuple, cast
 
 import bs4
 import httpx
@@ -27,6 +27,9 @@ class CustomAuth(AuthorizationClass):
     Cognito Reference: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/cognito-idp/client/admin_initiate_auth.html
     """
 
+    # Parsed .well-known/openid-configuration documents keyed by URL
+    _openid_cache: Dict[str, Dict[str, Any]] = {}
+
     def __init__(self, profile: Optional[Profile] = None):
         """Initialize CustomAuth Client for a profile.
 
@@ -69,8 +72,11 @@ class CustomAuth(AuthorizationClass):
             openid_url = (
                 f"{self.profile.idp_domain_url}/.well-known/openid-configuration"
             )
-        response = httpx.get(openid_url)
-        openid_config = response.raise_for_status().json()
+        openid_config = self._openid_cache.get(openid_url)
+        if openid_config is None:
+            response = httpx.get(openid_url)
+            openid_config = response.raise_for_status().json()
+            self._openid_cache[openid_url] = openid_config
 
         return openid_config.get("authorization_endpoint", ""), openid_config.get(
             "token_endpoint", ""
@@ -27,15 +27,20 @@ class BaseClient:
     http_client: httpx.Client
 
     def __init__(
-        self, authorizer: AuthorizationClass, custom_headers: Dict[str, Any] = {}
+        self,
+        authorizer: AuthorizationClass,
+        custom_headers: Dict[str, Any] = {},
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         """Initialize Client for a profile.
 
         :param profile:
+        :param transport: optional httpx transport used for API requests
         """
         logger.info("Initialize client...")
         self.authorizer = authorizer
         self.custom_headers = custom_headers
+        self.transport = transport
 
     def execute(
         self, operation_name: str, query: str, api_params: Dict[Any, Any]
@@ -49,7 +54,8 @@ class BaseClient:
             headers={
                 "Authorization": f"Bearer {self.authorizer.get_jwt_token()}",
                 **self.custom_headers,
-            }
+            },
+            transport=self.transport,
         )
         response = self._execute(
             query=query,
@@ -68,6 +74,9 @@ class BaseClient:
             raise GraphQLClientHttpError(
                 status_code=response.status_code, response=response
             )
+        # Skip decoding bodies that are not JSON (e.g. HTML error pages from proxies)
+        if "json" not in response.headers.get("content-type", "").lower():
+            raise GraphQLClientInvalidResponseError(response=response)
         try:
             response_json = response.json()
         except ValueError as exc:
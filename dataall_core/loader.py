@@ -4,9 +4,11 @@ import json
 import logging
 import os
 import re
+from functools import lru_cache
 from typing import Any, Optional, Tuple
 
 from graphql import (
+    GraphQLObjectType,
     GraphQLSchema,
     build_client_schema,
     is_enum_type,
@@ -54,10 +56,22 @@ def xform_name(
     return _xform_cache[key]
 
 
+@lru_cache(maxsize=32)
+def _load_client_schema(schema_path: str, mtime: float) -> GraphQLSchema:
+    """Build a GraphQL schema from an introspection JSON file.
+
+    ``mtime`` is only part of the cache key so that a modified file is parsed again.
+    """
+    with open(schema_path) as f:
+        schema_json = json.load(f)
+    return build_client_schema(schema_json)
+
+
 class Loader:
     """GraphQL Schema Loader."""
 
     schema: GraphQLSchema
+    operations: list[Tuple[str, str, GraphQLObjectType]]
 
     def __init__(
         self,
@@ -97,9 +111,18 @@ class Loader:
                 self.schema_path = os.path.join(SCHEMA_DIR, files[-1])
 
         logger.info(f"Loading Schema from path {self.schema_path}")
-        with open(self.schema_path) as f:
-            schema_json = json.load(f)
-        self.schema = build_client_schema(schema_json)
+        self.schema = _load_client_schema(
+            self.schema_path, os.path.getmtime(self.schema_path)
+        )
+        self.operations = [
+            (operation_kind, field_name, operation_type)
+            for operation_kind, operation_type in (
+                ("Query", self.schema.query_type),
+                ("Mutation", self.schema.mutation_type),
+            )
+            if operation_type
+            for field_name in operation_type.fields
+        ]
 
     def create_graphql_dict(self) -> dict[str, dict[str, Any]]:
         """Create a dictionary of GraphQL operations.
@@ -109,43 +132,29 @@ class Loader:
         - Dictionary of GraphQL operations.
         """
         op_dict = {}
+        max_depths = {
+            "Query": self.max_depth_query,
+            "Mutation": self.max_depth_mutation,
+        }
         try:
-            if self.schema.query_type:
-                for field in self.schema.query_type.fields:
-                    py_operation_name = xform_name(field)
-                    (
-                        query_string,
-                        input_arguments,
-                        flatten_args,
-                    ) = self._build_query_string(field, "Query", self.max_depth_query)
-                    docstring = self._build_docstring(field, self.schema.query_type)
-                    validate(self.schema, parse(query_string))
-                    op_dict[py_operation_name] = {
-                        "query_definition": query_string,
-                        "operation_name": field,
-                        "docstring": docstring,
-                        "input_args": input_arguments,
-                        "flatten_input_args": flatten_args,
-                    }
-            if self.schema.mutation_type:
-                for field in self.schema.mutation_type.fields:
-                    py_operation_name = xform_name(field)
-                    (
-                        query_string,
-                        input_arguments,
-                        flatten_args,
-                    ) = self._build_query_string(
-                        field, "Mutation", self.max_depth_mutation
-                    )
-                    docstring = self._build_docstring(field, self.schema.mutation_type)
-                    validate(self.schema, parse(query_string))
-                    op_dict[py_operation_name] = {
-                        "query_definition": query_string,
-                        "operation_name": field,
-                        "docstring": docstring,
-                        "input_args": input_arguments,
-                        "flatten_input_args": flatten_args,
-                    }
+            for operation_kind, field, operation_type in self.operations:
+                py_operation_name = xform_name(field)
+                (
+                    query_string,
+                    input_arguments,
+                    flatten_args,
+                ) = self._build_query_string(
+                    field, operation_kind, max_depths[operation_kind]
+                )
+                docstring = self._build_docstring(field, operation_type)
+                validate(self.schema, parse(query_string))
+                op_dict[py_operation_name] = {
+                    "query_definition": query_string,
+                    "operation_name": field,
+                    "docstring": docstring,
+                    "input_args": input_arguments,
+                    "flatten_input_args": flatten_args,
+                }
 
         except Exception as e:
             logger.error(f"Found error loading GraphQL schema: {e}")
@@ -100,21 +100,16 @@ class Profile:
             f"Get credentials of profile {self.profile_name} from {self.creds_path}"
         )
         if os.path.isfile(self.creds_path):
-            with open(self.creds_path) as file:
-                creds = yaml.full_load(file)
-                logger.debug(f"Retrieved creds: {creds}")
-                if self.profile_name in creds:
-                    self.credentials = ProfileCreds(
-                        token=creds[self.profile_name].get("token", None),
-                        expires_at=creds[self.profile_name].get("expires_at", None),
-                        refresh_token=creds[self.profile_name].get(
-                            "refresh_token", None
-                        ),
-                    )
-                else:
-                    logger.warn(
-                        f"No credentials found for Profile {self.profile_name}..."
-                    )
+            creds = _load_credentials_file(self.creds_path)
+            logger.debug(f"Retrieved creds: {creds}")
+            if creds and self.profile_name in creds:
+                self.credentials = ProfileCreds(
+                    token=creds[self.profile_name].get("token", None),
+                    expires_at=creds[self.profile_name].get("expires_at", None),
+                    refresh_token=creds[self.profile_name].get("refresh_token", None),
+                )
+            else:
+                logger.warn(f"No credentials found for Profile {self.profile_name}...")
         else:
             logger.warn(f"Credentials file {self.creds_path} does not exist...")
 
@@ -132,10 +127,9 @@ class Profile:
 
             if not os.path.isfile(self.creds_path):
                 with open(self.creds_path, "w+") as file:
-                    yaml.dump({self.profile_name: asdict(self.credentials)}, file)
+                    json.dump({self.profile_name: asdict(self.credentials)}, file)
             else:
-                with open(self.creds_path, "r") as file:
-                    creds = yaml.full_load(file)
+                creds = _load_credentials_file(self.creds_path)
 
                 if creds and self.profile_name in creds.keys():
                     creds.pop(self.profile_name)
@@ -144,7 +138,7 @@ class Profile:
                 creds[self.profile_name] = asdict(self.credentials)
 
                 with open(self.creds_path, "w") as file:
-                    yaml.dump(creds, file)
+                    json.dump(creds, file)
         except Exception as e:
             logger.warn(
                 f"Failed to save credentials at path {self.creds_path} due to: {e}"
@@ -154,6 +148,21 @@ class Profile:
             )
 
 
+def _load_credentials_file(creds_path: str) -> Any:
+    """Load the credentials file, written as JSON.
+
+    Files written by earlier versions are YAML and are rewritten as JSON on the next save.
+
+    :return: retrieved credentials for all profiles
+    """
+    with open(creds_path) as file:
+        content = file.read()
+    try:
+        return json.loads(content)
+    except ValueError:
+        return yaml.full_load(content)
+
+
 def get_profile(
     profile: str = DEFAULT_PROFILE,
     config_path: Path = CONFIG_PATH,
@@ -181,16 +190,15 @@ def get_profile_config_yaml(profile: str, config_path: Path) -> Any:
     """
     logger.info(f"Get config from {config_path}")
     if os.path.isfile(config_path):
-        with open(config_path) as file:
-            config = yaml.full_load(file)
-            logger.debug(f"Retrieved config: {config}")
-            if profile in config:
-                return config[profile]
-            else:
-                logger.warn(
-                    f"Profile {profile} is not configured for dataall_cli, please run configure() to set this profile..."
-                )
-                return
+        config = _load_config_file(config_path)
+        logger.debug(f"Retrieved config: {config}")
+        if profile in config:
+            return config[profile]
+        else:
+            logger.warn(
+                f"Profile {profile} is not configured for dataall_cli, please run configure() to set this profile..."
+            )
+            return
     else:
         logger.warn(
             f"Config file {config_path} does not exist, please the file {config_path} exists..."
@@ -198,6 +206,15 @@ def get_profile_config_yaml(profile: str, config_path: Path) -> Any:
         return
 
 
+def _load_config_file(config_path: Path) -> Any:
+    """Load the data.all config file.
+
+    :return: retrieved config for all profiles
+    """
+    with open(config_path) as file:
+        return yaml.full_load(file)
+
+
 def _parse_secret_arn(secret_arn: str) -> Tuple[str, Optional[str]]:
     arn_pattern = r"^arn:aws:secretsmanager:(.*?):(.*?):secret:(.*?)$"
     match = re.match(arn_pattern, secret_arn)
@@ -247,8 +264,7 @@ def save_profile(profile: Profile, config_path: Path = CONFIG_PATH) -> None:
         with open(config_path, "w+") as file:
             yaml.dump({profile.profile_name: updated_profile_dict}, file)
     else:
-        with open(config_path, "r") as file:
-            config = yaml.full_load(file)
+        config = _load_config_file(config_path)
 
         if config and profile.profile_name in config.keys():
             config.pop(profile.profile_name)
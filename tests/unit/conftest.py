@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from dataall_core.profile import AuthType, ConfigType, Profile
+
+USERNAME = "Username"
+PASSWORD = "Test123!"
+
+URL = "https://da-api-endpoint.com/tst"
+COGNITO_IDP_URL = "https://cognito-idp.com/"
+CUSTOM_IDP_URL = "https://custom-idp.com/"
+SESSION_TOKEN_ENDPOINT = "https://custom-idp.com/session/endpoint"
+
+PROFILE_CREDS_PATH = (
+    Path(__file__).resolve().parent / "test_profile" / "credentials.yaml"
+)
+
+
+@pytest.fixture(scope="session")
+def cognito_profile():
+    return Profile(
+        profile_name="CognitoDefault",
+        auth_type=AuthType.Cognito.value,
+        api_endpoint_url=URL,
+        username=USERNAME,
+        password=PASSWORD,
+        client_id="client_id",
+        redirect_uri="https://dataall-test.com/",
+        idp_domain_url=COGNITO_IDP_URL,
+        creds_path=str(PROFILE_CREDS_PATH),
+        config_type=ConfigType.SECRET.value,
+    )
+
+
+@pytest.fixture(scope="session")
+def custom_profile():
+    return Profile(
+        profile_name="CustomDefault",
+        auth_type=AuthType.Custom.value,
+        api_endpoint_url=URL,
+        username=USERNAME,
+        password=PASSWORD,
+        client_id="client_id",
+        redirect_uri="https://dataall-test.com/",
+        idp_domain_url=CUSTOM_IDP_URL,
+        session_token_endpoint=SESSION_TOKEN_ENDPOINT,
+        creds_path=str(PROFILE_CREDS_PATH),
+        config_type=ConfigType.SECRET.value,
+    )
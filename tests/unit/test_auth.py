@@ -1,5 +1,10 @@
 import logging
-import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 
 import httpx
 import pytest
@@ -7,117 +12,79 @@ import requests_mock
 import respx
 
 from dataall_core.auth import CognitoAuth, CustomAuth
-from dataall_core.profile import AuthType, ConfigType, Profile
+from dataall_core.profile import ProfileCreds
+from tests.unit.conftest import (
+    COGNITO_IDP_URL,
+    CUSTOM_IDP_URL,
+    PROFILE_CREDS_PATH,
+    SESSION_TOKEN_ENDPOINT,
+)
 
 logger = logging.getLogger("dataall_core").setLevel(logging.DEBUG)
 
-USERNAME = "Username"
-PASSWORD = "Test123!"
-
-PROFILE_CREDS = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)), "test_profile", "credentials.yaml"
-)
-
 
 @pytest.fixture(autouse=True)
-def cleanup_creds():
+def cleanup_creds(cognito_profile, custom_profile):
     yield
-    if os.path.exists(PROFILE_CREDS):
-        os.remove(PROFILE_CREDS)
-
-
-@pytest.fixture(scope="function")
-def cognito_profile():
-    return Profile(
-        profile_name="CognitoDefault",
-        auth_type=AuthType.Cognito.value,
-        api_endpoint_url="https://da-api-endpoint.com/tst",
-        username=USERNAME,
-        password=PASSWORD,
-        client_id="client_id",
-        redirect_uri="https://dataall-test.com/",
-        idp_domain_url="https://cognito-idp.com/",
-        creds_path=PROFILE_CREDS,
-        config_type=ConfigType.SECRET.value,
-    )
+    PROFILE_CREDS_PATH.unlink(missing_ok=True)
+    # Profiles are shared across the session, drop tokens obtained by the test
+    cognito_profile.credentials = ProfileCreds()
+    custom_profile.credentials = ProfileCreds()
 
 
-@pytest.fixture(scope="function")
-def custom_profile():
-    return Profile(
-        profile_name="CustomDefault",
-        auth_type=AuthType.Custom.value,
-        api_endpoint_url="https://da-api-endpoint.com/tst",
-        username=USERNAME,
-        password=PASSWORD,
-        client_id="client_id",
-        redirect_uri="https://dataall-test.com/",
-        idp_domain_url="https://custom-idp.com/",
-        session_token_endpoint="https://custom-idp.com/session/endpoint",
-        creds_path=PROFILE_CREDS,
-        config_type=ConfigType.SECRET.value,
-    )
-
-
-@pytest.fixture(scope="function")
-def mocked_cognito_api(cognito_profile):
+def _register_cognito_routes(mock):
     login_endpoint = "/login"
     token_endpoint = "/oauth2/token"
 
-    with requests_mock.Mocker() as mock:
-        mock.register_uri(
-            "POST",
-            login_endpoint,
-            status_code=200,
-            headers={
-                "location": f"{cognito_profile.idp_domain_url}{login_endpoint}?code=1X1X1AUTHCODE1X1X1&state=xyz"
-            },
-        )
-        mock.register_uri(
-            "POST",
-            token_endpoint,
-            status_code=200,
-            json={
-                "access_token": "sampleAccessTokenValueHere",
-                "expires_in": 3600,
-                "refresh_token": "sampleRefreshTokenValueHere",
-            },
-        )
-        yield mock
+    mock.register_uri(
+        "POST",
+        login_endpoint,
+        status_code=200,
+        headers={
+            "location": f"{COGNITO_IDP_URL}{login_endpoint}?code=1X1X1AUTHCODE1X1X1&state=xyz"
+        },
+    )
+    mock.register_uri(
+        "POST",
+        token_endpoint,
+        status_code=200,
+        json={
+            "access_token": "sampleAccessTokenValueHere",
+            "expires_in": 3600,
+            "refresh_token": "sampleRefreshTokenValueHere",
+        },
+    )
 
 
-@pytest.fixture(scope="function")
-def mocked_custom_api(custom_profile):
+def _register_custom_routes(respx_mock):
     auth_endpoint = "/tst/auth"
     token_endpoint = "/tst/token"
-    with respx.mock(base_url=f"{custom_profile.idp_domain_url}") as respx_mock:
-        # Mock Get Endpoints - .well-known/openid-configuration (Not supported by moto mocker)
-        openid_endpoints = respx_mock.get(
-            "/.well-known/openid-configuration", name="openid_endpoints"
-        )
-        openid_endpoints.return_value = httpx.Response(
-            200,
-            json={
-                "authorization_endpoint": f"{custom_profile.idp_domain_url}{auth_endpoint}",
-                "token_endpoint": f"{custom_profile.idp_domain_url}{token_endpoint}",
-            },
-        )
-        # Mock Get Session Token Endpoint
-        session_token_endpoint = respx_mock.post(
-            f"{'/'.join(custom_profile.session_token_endpoint.split('/')[3:])}",
-            name="session_token_endpoint",
-        )
-        session_token_endpoint.return_value = httpx.Response(
-            200,
-            json={
-                "sessionToken": "test-session-token",
-            },
-        )
-        # Mock Get Session Token Endpoint
-        session_token_endpoint = respx_mock.get(auth_endpoint, name="auth_endpoint")
-        session_token_endpoint.return_value = httpx.Response(
-            200,
-            html="""
+    # Mock Get Endpoints - .well-known/openid-configuration (Not supported by moto mocker)
+    openid_endpoints = respx_mock.get(
+        "/.well-known/openid-configuration", name="openid_endpoints"
+    )
+    openid_endpoints.return_value = httpx.Response(
+        200,
+        json={
+            "authorization_endpoint": f"{CUSTOM_IDP_URL}{auth_endpoint}",
+            "token_endpoint": f"{CUSTOM_IDP_URL}{token_endpoint}",
+        },
+    )
+    # Mock Get Session Token Endpoint
+    session_token_endpoint = respx_mock.post(
+        urlsplit(SESSION_TOKEN_ENDPOINT).path, name="session_token_endpoint"
+    )
+    session_token_endpoint.return_value = httpx.Response(
+        200,
+        json={
+            "sessionToken": "test-session-token",
+        },
+    )
+    # Mock Get Session Token Endpoint
+    session_token_endpoint = respx_mock.get(auth_endpoint, name="auth_endpoint")
+    session_token_endpoint.return_value = httpx.Response(
+        200,
+        html="""
 <html>
 
 <head>
@@ -132,19 +99,44 @@ def mocked_custom_api(custom_profile):
 
 </html>
 """,
-        )
-        session_token_endpoint = respx_mock.post(token_endpoint, name="token_endpoint")
-        session_token_endpoint.return_value = httpx.Response(
-            200,
-            json={
-                "access_token": "sampleTokenValueHere",
-                "expires_in": 3600,
-            },
-        )
+    )
+    session_token_endpoint = respx_mock.post(token_endpoint, name="token_endpoint")
+    session_token_endpoint.return_value = httpx.Response(
+        200,
+        json={
+            "access_token": "sampleTokenValueHere",
+            "expires_in": 3600,
+        },
+    )
+
 
+@pytest.fixture(scope="module")
+def cognito_api_router():
+    with requests_mock.Mocker() as mock:
+        _register_cognito_routes(mock)
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def custom_api_router():
+    with respx.mock(base_url=CUSTOM_IDP_URL, assert_all_called=False) as respx_mock:
+        _register_custom_routes(respx_mock)
         yield respx_mock
 
 
+@pytest.fixture(scope="function")
+def mocked_cognito_api(cognito_api_router):
+    cognito_api_router.reset_mock()
+    yield cognito_api_router
+
+
+@pytest.fixture(scope="function")
+def mocked_custom_api(custom_api_router):
+    custom_api_router.reset()
+    CustomAuth._openid_cache.clear()
+    yield custom_api_router
+
+
 def test_init_no_profile():
     auth = CognitoAuth()
     assert auth.profile is None
@@ -164,10 +156,38 @@ def test_authenticate_and_get_token_cognito(cognito_profile, mocked_cognito_api)
 
     token2 = auth.get_jwt_token()
     assert token == token2
+    assert mocked_cognito_api.call_count == 2
+
+    # Fresh client for the same profile reuses the token persisted in creds_path
+    warm_auth = CognitoAuth(replace(cognito_profile, credentials=ProfileCreds()))
+    assert warm_auth.get_jwt_token() == token
+    assert mocked_cognito_api.call_count == 2
+
+
+def test_get_token_reloads_persisted_credentials(cognito_profile, mocked_cognito_api):
+    auth = CognitoAuth(cognito_profile)
+    auth.get_jwt_token()
+    call_count = mocked_cognito_api.call_count
+
+    # Another process persists a fresh token for the same profile
+    other_profile = replace(cognito_profile, credentials=ProfileCreds())
+    other_profile.credentials = ProfileCreds(
+        token="persistedAccessTokenValueHere",
+        expires_at=(datetime.now() + timedelta(hours=1)).isoformat(),
+        refresh_token="persistedRefreshTokenValueHere",
+    )
+    other_profile.save_credentials()
+
+    auth.profile.credentials.expires_at = (
+        datetime.now() - timedelta(minutes=1)
+    ).isoformat()
+
+    assert auth.get_jwt_token() == "persistedAccessTokenValueHere"
+    assert mocked_cognito_api.call_count == call_count
 
 
 def test_authenticate_and_get_token_cognito_refresh(
-    mocked_cognito_api, cognito_profile
+    mocked_cognito_api, cognito_profile, mocker
 ):
     auth = CognitoAuth(cognito_profile)
     auth.get_jwt_token()
@@ -177,20 +197,82 @@ def test_authenticate_and_get_token_cognito_refresh(
     assert auth.profile.credentials.refresh_token
 
     # When token expiry is met - assert new token can be accessed via refresh token
-    auth.profile.credentials.expires_at = None
+    mock_datetime = mocker.patch("dataall_core.auth.auth.datetime", wraps=datetime)
+    mock_datetime.now.return_value = datetime.now() + timedelta(hours=2)
     auth.get_jwt_token()
 
     assert auth.profile.credentials.token
     assert auth.profile.credentials.expires_at
     assert auth.profile.credentials.refresh_token
+    assert mocked_cognito_api.last_request.qs["grant_type"] == ["refresh_token"]
+
+
+def test_concurrent_refresh_single_call(mocked_cognito_api, cognito_profile):
+    auth = CognitoAuth(cognito_profile)
+    auth.get_jwt_token()
+
+    # Expire the token in memory and on disk so every caller needs a refresh
+    auth.profile.credentials.expires_at = (
+        datetime.now() - timedelta(minutes=1)
+    ).isoformat()
+    auth.profile.save_credentials()
+    mocked_cognito_api.reset_mock()
+
+    def slow_token_response(request, context):
+        # Keep the refresh in flight until every worker has checked token expiry
+        time.sleep(0.2)
+        return {
+            "access_token": "refreshedAccessTokenValueHere",
+            "expires_in": 3600,
+        }
+
+    barrier = threading.Barrier(10)
+
+    def get_token(_):
+        barrier.wait()
+        return auth.get_jwt_token()
+
+    mocked_cognito_api.register_uri(
+        "POST", "/oauth2/token", status_code=200, json=slow_token_response
+    )
+    try:
+        with ThreadPoolExecutor(10) as executor:
+            tokens = list(executor.map(get_token, range(10)))
+    finally:
+        _register_cognito_routes(mocked_cognito_api)
+
+    assert set(tokens) == {"refreshedAccessTokenValueHere"}
+    token_calls = [
+        r for r in mocked_cognito_api.request_history if r.path == "/oauth2/token"
+    ]
+    assert len(token_calls) == 1
 
 
 def test_authenticate_and_get_token_custom(custom_profile, mocked_custom_api):
     # Get Token Custom Auth
     auth = CustomAuth(custom_profile)
-    auth.get_jwt_token()
+    token = auth.get_jwt_token()
     assert auth.profile.credentials.token
     assert auth.profile.credentials.expires_at
+    call_count = mocked_custom_api.calls.call_count
+
+    assert auth.get_jwt_token() == token
+    warm_auth = CustomAuth(replace(custom_profile, credentials=ProfileCreds()))
+    assert warm_auth.get_jwt_token() == token
+    assert mocked_custom_api.calls.call_count == call_count
+
+
+def test_custom_auth_openid_cached(custom_profile, mocked_custom_api):
+    auth = CustomAuth(custom_profile)
+    auth.get_jwt_token()
+
+    # Drop the token so the second call runs the full authentication flow again
+    auth.profile.credentials = ProfileCreds()
+    PROFILE_CREDS_PATH.unlink(missing_ok=True)
+    auth.get_jwt_token()
+
+    assert mocked_custom_api.routes["token_endpoint"].call_count == 2
+    assert mocked_custom_api.routes["openid_endpoints"].call_count == 1
 
 
 def test_authenticate_and_get_token_no_profile():
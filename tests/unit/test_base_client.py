@@ -1,9 +1,8 @@
-import os
 from unittest.mock import patch
+from urllib.parse import urlsplit
 
 import httpx
 import pytest
-import respx
 
 from dataall_core.auth import AuthorizationClass, CustomAuth
 from dataall_core.base_client import QUERY_ENDPOINT, BaseClient
@@ -12,32 +11,7 @@ from dataall_core.exceptions import (
     GraphQLClientHttpError,
     GraphQLClientInvalidResponseError,
 )
-from dataall_core.profile import AuthType, ConfigType, Profile
-
-USERNAME = "Username"
-PASSWORD = "Test123!"
-
-URL = "https://da-api-endpoint.com/tst"
-
-PROFILE_CREDS = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)), "test_profile", "credentials.yaml"
-)
-
-
-@pytest.fixture(scope="module")
-def custom_profile():
-    return Profile(
-        profile_name="default",
-        auth_type=AuthType.Custom.value,
-        api_endpoint_url="https://da-api-endpoint.com/tst",
-        username=USERNAME,
-        password=PASSWORD,
-        client_id="client_id",
-        redirect_uri="https://dataall-test.com/",
-        idp_domain_url="https://custom-idp.com/",
-        session_token_endpoint="https://custom-idp.com/session/endpoint",
-        config_type=ConfigType.SECRET.value,
-    )
+from tests.unit.conftest import URL
 
 
 @pytest.fixture
@@ -48,54 +22,82 @@ def mock_get_jwt_token():
 
 
 @pytest.fixture(scope="module")
-def mocked_custom_api():
-    with respx.mock(base_url=URL) as respx_mock:
-        yield respx_mock
+def mock_transport():
+    def _mock_transport(response):
+        routes = {urlsplit(URL).path + QUERY_ENDPOINT: response}
+
+        def handler(request):
+            if request.url.path not in routes:
+                raise AssertionError(f"unexpected request {request.url}")
+            return routes[request.url.path]
+
+        return httpx.MockTransport(handler)
+
+    return _mock_transport
 
 
 @pytest.fixture
-def mock_query_success(mocked_custom_api):
-    api_endpoints = mocked_custom_api.post(QUERY_ENDPOINT, name="api_endpoints")
-    api_endpoints.return_value = httpx.Response(
-        200, json={"data": {"tstOperation": {"somekey": "somevalue"}}}
+def mock_query_success(mock_transport):
+    return mock_transport(
+        httpx.Response(200, json={"data": {"tstOperation": {"somekey": "somevalue"}}})
     )
 
 
 @pytest.fixture
-def mock_query_error(mocked_custom_api):
-    api_endpoints = mocked_custom_api.post(QUERY_ENDPOINT, name="api_endpoints")
-    api_endpoints.return_value = httpx.Response(
-        200,
-        json={
-            "data": {"somekey": "somevalue"},
-            "errors": [{"message": "error1"}, {"message": "error2"}],
-        },
+def mock_query_error(mock_transport):
+    return mock_transport(
+        httpx.Response(
+            200,
+            json={
+                "data": {"somekey": "somevalue"},
+                "errors": [{"message": "error1"}, {"message": "error2"}],
+            },
+        )
     )
 
 
 @pytest.fixture
-def mock_query_invalid_response1(mocked_custom_api):
-    api_endpoints = mocked_custom_api.post(QUERY_ENDPOINT, name="api_endpoints")
-    api_endpoints.return_value = httpx.Response(
-        200, json={"randomkey": {"somekey": "somevalue"}}
+def mock_query_invalid_response1(mock_transport):
+    return mock_transport(
+        httpx.Response(200, json={"randomkey": {"somekey": "somevalue"}})
     )
 
 
 @pytest.fixture
-def mock_query_invalid_response2(mocked_custom_api):
-    api_endpoints = mocked_custom_api.post(QUERY_ENDPOINT, name="api_endpoints")
-    api_endpoints.return_value = httpx.Response(200, text="non-json reponse")
+def mock_query_invalid_response2(mock_transport):
+    return mock_transport(httpx.Response(200, text="non-json reponse"))
 
 
 @pytest.fixture
-def mock_query_error_code(mocked_custom_api):
-    api_endpoints = mocked_custom_api.post(QUERY_ENDPOINT, name="api_endpoints")
-    api_endpoints.return_value = httpx.Response(404, text="non-json reponse")
+def mock_query_invalid_content_type(mock_transport):
+    return mock_transport(
+        httpx.Response(
+            200,
+            content=b'{"data": {"tstOperation": {"somekey": "somevalue"}}}',
+            headers={"content-type": "text/html"},
+        )
+    )
+
+
+@pytest.fixture
+def mock_query_upper_case_content_type(mock_transport):
+    return mock_transport(
+        httpx.Response(
+            200,
+            content=b'{"data": {"tstOperation": {"somekey": "somevalue"}}}',
+            headers={"content-type": "Application/JSON"},
+        )
+    )
+
+
+@pytest.fixture
+def mock_query_error_code(mock_transport):
+    return mock_transport(httpx.Response(404, text="non-json reponse"))
 
 
 def test_base_client_execute(mock_query_success, mock_get_jwt_token, custom_profile):
     auth = CustomAuth(profile=custom_profile)
-    base_client = BaseClient(authorizer=auth)
+    base_client = BaseClient(authorizer=auth, transport=mock_query_success)
     response = base_client.execute(
         operation_name="tstOperation", query="query testQuery1 (){ }", api_params={}
     )
@@ -103,18 +105,26 @@ def test_base_client_execute(mock_query_success, mock_get_jwt_token, custom_prof
     assert response == {"somekey": "somevalue"}
 
 
-def test_base_client_execute_custom_headers(
-    mocked_custom_api, mock_query_success, mock_get_jwt_token, custom_profile
-):
+def test_base_client_execute_custom_headers(mock_get_jwt_token, custom_profile):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200, json={"data": {"tstOperation": {"somekey": "somevalue"}}}
+        )
+
     auth = CustomAuth(profile=custom_profile)
     base_client = BaseClient(
-        authorizer=auth, custom_headers={"X-Custom-Header": "custom-value"}
+        authorizer=auth,
+        custom_headers={"X-Custom-Header": "custom-value"},
+        transport=httpx.MockTransport(handler),
     )
     base_client.execute(
         operation_name="tstOperation", query="query testQuery1 (){ }", api_params={}
     )
 
-    request = mocked_custom_api.calls[-1].request
+    request = requests[-1]
 
     assert "X-Custom-Header" in request.headers
     assert request.headers["X-Custom-Header"] == "custom-value"
@@ -124,7 +134,7 @@ def test_base_client_execute_error(
     mock_query_error, mock_get_jwt_token, custom_profile
 ):
     auth = CustomAuth(profile=custom_profile)
-    base_client = BaseClient(authorizer=auth)
+    base_client = BaseClient(authorizer=auth, transport=mock_query_error)
 
     with pytest.raises(GraphQLClientGraphQLMultiError) as e:
         base_client.execute(
@@ -137,7 +147,7 @@ def test_base_client_invalid_response1(
     mock_query_invalid_response1, mock_get_jwt_token, custom_profile
 ):
     auth = CustomAuth(profile=custom_profile)
-    base_client = BaseClient(authorizer=auth)
+    base_client = BaseClient(authorizer=auth, transport=mock_query_invalid_response1)
 
     with pytest.raises(GraphQLClientInvalidResponseError) as e:
         base_client.execute(
@@ -150,7 +160,7 @@ def test_base_client_invalid_response2(
     mock_query_invalid_response2, mock_get_jwt_token, custom_profile
 ):
     auth = CustomAuth(profile=custom_profile)
-    base_client = BaseClient(authorizer=auth)
+    base_client = BaseClient(authorizer=auth, transport=mock_query_invalid_response2)
 
     with pytest.raises(GraphQLClientInvalidResponseError) as e:
         base_client.execute(
@@ -159,11 +169,37 @@ def test_base_client_invalid_response2(
     assert str(e.value) == "Invalid response format."
 
 
+def test_base_client_invalid_content_type(
+    mock_query_invalid_content_type, mock_get_jwt_token, custom_profile
+):
+    auth = CustomAuth(profile=custom_profile)
+    base_client = BaseClient(authorizer=auth, transport=mock_query_invalid_content_type)
+
+    with pytest.raises(GraphQLClientInvalidResponseError) as e:
+        base_client.execute(
+            operation_name="tstOperation", query="query testQuery1 (){ }", api_params={}
+        )
+    assert str(e.value) == "Invalid response format."
+
+
+def test_base_client_upper_case_content_type(
+    mock_query_upper_case_content_type, mock_get_jwt_token, custom_profile
+):
+    auth = CustomAuth(profile=custom_profile)
+    base_client = BaseClient(
+        authorizer=auth, transport=mock_query_upper_case_content_type
+    )
+    response = base_client.execute(
+        operation_name="tstOperation", query="query testQuery1 (){ }", api_params={}
+    )
+    assert response == {"somekey": "somevalue"}
+
+
 def test_base_client_error_code(
     mock_query_error_code, mock_get_jwt_token, custom_profile
 ):
     auth = CustomAuth(profile=custom_profile)
-    base_client = BaseClient(authorizer=auth)
+    base_client = BaseClient(authorizer=auth, transport=mock_query_error_code)
 
     with pytest.raises(GraphQLClientHttpError) as e:
         base_client.execute(
@@ -1,6 +1,5 @@
 import json
 import uuid
-from unittest.mock import MagicMock
 
 import pytest
 from graphql import GraphQLInputObjectType, GraphQLString
@@ -9,8 +8,10 @@ from dataall_core.base_client import BaseClient
 from dataall_core.dataall_client import DataallClient
 from dataall_core.loader import Loader
 
+_MUTATION1_QUERY: str = "\nmutation testMutation1 ($input: NewInput){\n  testMutation1(input: $input){\n    AwsAccountId\n    GlueCrawlerName\n    GlueCrawlerSchedule\n    GlueDatabaseName\n    GlueProfilingJobName\n    GlueProfilingTriggerSchedule\n    IAMDatasetAdminRoleArn\n    KmsAlias\n    S3BucketName\n    SamlAdminGroupName\n    admins\n    bucketCreated\n    bucketPolicyCreated\n    businessOwnerDelegationEmails\n    businessOwnerEmail\n    created\n    datasetUri\n    description\n    environment {\n      AwsAccountId\n      EnvironmentDefaultAthenaWorkGroup\n      EnvironmentDefaultBucketName\n      EnvironmentDefaultIAMRoleArn\n      EnvironmentDefaultIAMRoleImported\n      EnvironmentDefaultIAMRoleName\n      SamlGroupName\n      created\n      datasets\n      deleted\n      description\n      environmentType\n      environmentUri\n      isOrganizationDefaultEnvironment\n      label\n      name\n      owner\n      region\n      resourcePrefix\n      roleCreated\n      subscriptionsConsumersTopicImported\n      subscriptionsConsumersTopicName\n      subscriptionsEnabled\n      subscriptionsProducersTopicImported\n      subscriptionsProducersTopicName\n      updated\n      validated\n    }\n    glueDatabaseCreated\n    iamAdminRoleCreated\n    imported\n    importedAdminRole\n    importedGlueDatabase\n    importedKmsKey\n    importedS3Bucket\n    label\n    lakeformationLocationCreated\n    locations {\n      count\n      hasNext\n      hasPrevious\n      page\n      pages\n    }\n    name\n    organization {\n      SamlGroupName\n      created\n      description\n      label\n      name\n      organizationUri\n      owner\n      updated\n    }\n    owner\n    owners\n    region\n    shares {\n      count\n      hasNext\n      hasPrevious\n      nextPage\n      page\n      pageSize\n      pages\n      previousPage\n    }\n    stack {\n      EcsTaskArn\n      EcsTaskId\n      environmentUri\n      error\n      events\n      link\n      name\n      outputs\n      resources\n      stackUri\n      stackid\n      status\n    }\n    statistics {\n      locations\n      tables\n      upvotes\n    }\n    stewards\n    tables {\n      count\n      hasNext\n      hasPrevious\n      page\n      pages\n    }\n    tags\n    terms {\n      count\n      hasNext\n      hasPrevious\n      page\n      pages\n    }\n    updated\n\n  }\n}"
 
-def sample_graphql_dict():
+
+def _build_sample_graphql_dict():
     return {
         "test_query1": {
             "operation_name": "testQuery1",
@@ -21,7 +22,7 @@ def sample_graphql_dict():
         },
         "test_mutation1": {
             "operation_name": "testMutation1",
-            "query_definition": "\nmutation testMutation1 ($input: NewInput){\n  testMutation1(input: $input){\n    AwsAccountId\n    GlueCrawlerName\n    GlueCrawlerSchedule\n    GlueDatabaseName\n    GlueProfilingJobName\n    GlueProfilingTriggerSchedule\n    IAMDatasetAdminRoleArn\n    KmsAlias\n    S3BucketName\n    SamlAdminGroupName\n    admins\n    bucketCreated\n    bucketPolicyCreated\n    businessOwnerDelegationEmails\n    businessOwnerEmail\n    created\n    datasetUri\n    description\n    environment {\n      AwsAccountId\n      EnvironmentDefaultAthenaWorkGroup\n      EnvironmentDefaultBucketName\n      EnvironmentDefaultIAMRoleArn\n      EnvironmentDefaultIAMRoleImported\n      EnvironmentDefaultIAMRoleName\n      SamlGroupName\n      created\n      datasets\n      deleted\n      description\n      environmentType\n      environmentUri\n      isOrganizationDefaultEnvironment\n      label\n      name\n      owner\n      region\n      resourcePrefix\n      roleCreated\n      subscriptionsConsumersTopicImported\n      subscriptionsConsumersTopicName\n      subscriptionsEnabled\n      subscriptionsProducersTopicImported\n      subscriptionsProducersTopicName\n      updated\n      validated\n    }\n    glueDatabaseCreated\n    iamAdminRoleCreated\n    imported\n    importedAdminRole\n    importedGlueDatabase\n    importedKmsKey\n    importedS3Bucket\n    label\n    lakeformationLocationCreated\n    locations {\n      count\n      hasNext\n      hasPrevious\n      page\n      pages\n    }\n    name\n    organization {\n      SamlGroupName\n      created\n      description\n      label\n      name\n      organizationUri\n      owner\n      updated\n    }\n    owner\n    owners\n    region\n    shares {\n      count\n      hasNext\n      hasPrevious\n      nextPage\n      page\n      pageSize\n      pages\n      previousPage\n    }\n    stack {\n      EcsTaskArn\n      EcsTaskId\n      environmentUri\n      error\n      events\n      link\n      name\n      outputs\n      resources\n      stackUri\n      stackid\n      status\n    }\n    statistics {\n      locations\n      tables\n      upvotes\n    }\n    stewards\n    tables {\n      count\n      hasNext\n      hasPrevious\n      page\n      pages\n    }\n    tags\n    terms {\n      count\n      hasNext\n      hasPrevious\n      page\n      pages\n    }\n    updated\n\n  }\n}",
+            "query_definition": _MUTATION1_QUERY,
             "docstring": "This is a placeholder description of the operation \n\n\tParameters\n\t----------\n\tinput : NewInput\n\t\tThis is a placeholder description of the input field\n\n\tReturns\n\t-------\n\tDict[str, Any]\n\t\tDataset\n",
             "input_args": {
                 "input": GraphQLInputObjectType(
@@ -61,12 +62,35 @@ def sample_graphql_dict():
     }
 
 
+SAMPLE_GRAPHQL_DICT = _build_sample_graphql_dict()
+
+
+def sample_graphql_dict():
+    return SAMPLE_GRAPHQL_DICT
+
+
+class _StubLoader(Loader):
+    def load_schema(self, **_):
+        return {}
+
+    def create_graphql_dict(self, **_):
+        return SAMPLE_GRAPHQL_DICT
+
+
 @pytest.fixture(scope="module")
 def mock_loader():
-    mock_loader = MagicMock(spec=Loader)
-    mock_loader.load_schema.return_value = {}
-    mock_loader.create_graphql_dict.return_value = sample_graphql_dict()
-    yield mock_loader
+    # Skip Loader.__init__, the stub never reads the max depth settings
+    yield _StubLoader.__new__(_StubLoader)
+
+
+@pytest.fixture(scope="session")
+def default_client():
+    return DataallClient(loader=Loader())
+
+
+@pytest.fixture(scope="session")
+def default_client_v25():
+    return DataallClient(loader=Loader(), schema_version="v2_5")
 
 
 @pytest.fixture
@@ -74,18 +98,16 @@ def mock_sub(mocker):
     yield mocker.patch("re.sub")
 
 
-def test_dataall_client_init_default():
-    client = DataallClient()
-    assert isinstance(client.loader, Loader)
-    assert client.op_dict
-    assert len(client.op_dict)
+def test_dataall_client_init_default(default_client):
+    assert isinstance(default_client.loader, Loader)
+    assert default_client.op_dict
+    assert len(default_client.op_dict)
 
 
-def test_dataall_client_init_schema_version():
-    client = DataallClient(schema_version="v2_5")
-    assert isinstance(client.loader, Loader)
-    assert client.op_dict
-    assert len(client.op_dict)
+def test_dataall_client_init_schema_version(default_client_v25):
+    assert isinstance(default_client_v25.loader, Loader)
+    assert default_client_v25.op_dict
+    assert len(default_client_v25.op_dict)
 
 
 def test_dataall_client_init_mock_loader(mock_loader):
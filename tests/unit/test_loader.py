@@ -1,5 +1,6 @@
 import logging
 import os
+import shutil
 
 import pytest
 from graphql import assert_valid_schema
@@ -15,7 +16,18 @@ from dataall_core.loader import (
 logging.getLogger("dataall_core").setLevel(logging.DEBUG)
 
 EXAMPLE_SCHEMAS_DIR = os.path.join(os.path.dirname(__file__), "test_schema")
-EXAMPLE_SCHEMAS = os.listdir(EXAMPLE_SCHEMAS_DIR)
+
+
+def _schema_files(schema_dir):
+    return sorted(
+        e.name
+        for e in os.scandir(schema_dir)
+        if e.is_file() and e.name.endswith(".json")
+    )
+
+
+EXAMPLE_SCHEMAS = _schema_files(EXAMPLE_SCHEMAS_DIR)
+SCHEMA_FILES = _schema_files(SCHEMA_DIR)
 
 
 @pytest.fixture(scope="function")
@@ -24,48 +36,57 @@ def default_loader():
 
 
 @pytest.fixture
-def mock_sub(mocker):
-    yield mocker.patch("re.sub")
+def mock_regexes(mocker):
+    yield (
+        mocker.patch("dataall_core.loader._first_cap_regex"),
+        mocker.patch("dataall_core.loader._end_cap_regex"),
+    )
 
 
-def test_xform_name_transform():
-    fields = [
+@pytest.mark.parametrize(
+    "name,expected",
+    [
         ("testCreate", "test_create"),
         ("TestCreate", "test_create"),
         ("TESTCREATE", "testcreate"),
         ("testcreatE", "testcreat_e"),
         ("testCREATE", "test_create"),
         ("    TESTCREATE     ", "testcreate"),
-    ]
-    for field in fields:
-        assert xform_name(field[0]) == field[1]
-
-
-def test_xform_name_unchanged():
-    fields = ["test_create", "TEST_CREATE", "Test_Create", "    TEST_CREATE     "]
-    for field in fields:
-        assert xform_name(field) == field
+    ],
+)
+def test_xform_name_transform(name, expected):
+    assert xform_name(name) == expected
 
 
-def test_xform_name_new_sep():
-    fields = [
-        ("testCreate", "test.create"),
-        ("TESTCREATE", "testcreate"),
-        ("testcreatE", "testcreat.e"),
-        ("testCREATE", "test.create"),
-        ("    TESTCREATE     ", "testcreate"),
-        ("Test.Create", "Test.Create"),
-        ("test_cREATE", "test_c.reate"),
-    ]
-    for field in fields:
-        assert xform_name(field[0], sep=".") == field[1]
+@pytest.mark.parametrize(
+    "name", ["test_create", "TEST_CREATE", "Test_Create", "    TEST_CREATE     "]
+)
+def test_xform_name_unchanged(name):
+    assert xform_name(name) == name
+
+
+@pytest.mark.parametrize(
+    "name,sep,expected",
+    [
+        ("testCreate", ".", "test.create"),
+        ("TESTCREATE", ".", "testcreate"),
+        ("testcreatE", ".", "testcreat.e"),
+        ("testCREATE", ".", "test.create"),
+        ("    TESTCREATE     ", ".", "testcreate"),
+        ("Test.Create", ".", "Test.Create"),
+        ("test_cREATE", ".", "test_c.reate"),
+    ],
+)
+def test_xform_name_new_sep(name, sep, expected):
+    assert xform_name(name, sep=sep) == expected
 
 
-def test_xform_name_cache(mock_sub):
+def test_xform_name_cache(mock_regexes):
     xform_cache = {("testCreate", "_"): "test_create"}
     transformed_name = xform_name("testCreate", _xform_cache=xform_cache)
     assert transformed_name == "test_create"
-    assert mock_sub.call_count == 0
+    for mock_regex in mock_regexes:
+        assert mock_regex.sub.call_count == 0
 
 
 def test_loader_init():
@@ -87,22 +108,18 @@ def test_loader_init_default():
 def test_load_schema_default():
     loader = Loader()
     loader.load_schema()
-    files = os.listdir(SCHEMA_DIR)
-    files.sort()
-    assert loader.schema_path == os.path.join(SCHEMA_DIR, files[-1])
+    assert loader.schema_path == os.path.join(SCHEMA_DIR, SCHEMA_FILES[-1])
     assert loader.schema
     assert_valid_schema(loader.schema)
 
 
-def test_load_schema_versions():
-    files = os.listdir(SCHEMA_DIR)
-    files.sort()
-    for f in files:
-        loader = Loader()
-        loader.load_schema(schema_version=f.split(".")[0])
-        assert loader.schema_path == os.path.join(SCHEMA_DIR, f)
-        assert loader.schema
-        assert_valid_schema(loader.schema)
+@pytest.mark.parametrize("schema_file", SCHEMA_FILES)
+def test_load_schema_versions(schema_file):
+    loader = Loader()
+    loader.load_schema(schema_version=schema_file.split(".")[0])
+    assert loader.schema_path == os.path.join(SCHEMA_DIR, schema_file)
+    assert loader.schema
+    assert_valid_schema(loader.schema)
 
 
 def test_load_schema_empty_path():
@@ -129,6 +146,30 @@ def test_create_graphql_dict_default():
     assert len(graphql_dict) == len(loader.schema.query_type.fields) + len(
         loader.schema.mutation_type.fields
     )
+    assert len(loader.operations) == len(graphql_dict)
+
+
+def test_load_schema_cached():
+    schema_path = os.path.join(EXAMPLE_SCHEMAS_DIR, EXAMPLE_SCHEMAS[0])
+    loader1 = Loader()
+    loader1.load_schema(schema_path=schema_path)
+    loader2 = Loader()
+    loader2.load_schema(schema_path=schema_path)
+    assert loader1.schema is loader2.schema
+
+
+def test_load_schema_reparse_on_mtime_change(tmp_path):
+    schema_path = str(tmp_path / "schema.json")
+    shutil.copy(os.path.join(EXAMPLE_SCHEMAS_DIR, EXAMPLE_SCHEMAS[0]), schema_path)
+    loader = Loader()
+    loader.load_schema(schema_path=schema_path)
+    schema = loader.schema
+
+    mtime = os.path.getmtime(schema_path)
+    os.utime(schema_path, (mtime + 10, mtime + 10))
+    loader.load_schema(schema_path=schema_path)
+    assert loader.schema is not schema
+    assert_valid_schema(loader.schema)
 
 
 @pytest.mark.parametrize("filename", EXAMPLE_SCHEMAS)
@@ -1,11 +1,12 @@
 import json
 import os
 import tempfile
+import uuid
+from copy import deepcopy
 from pathlib import Path
 
-import boto3
-import moto
 import pytest
+import yaml
 
 from dataall_core.exceptions import (
     MissingParameterSecretException,
@@ -15,31 +16,39 @@ from dataall_core.profile import (
     AuthType,
     ConfigType,
     Profile,
+    ProfileCreds,
+    _load_config_file,
     get_profile,
     get_profile_config_yaml,
     get_profile_secret_value,
     save_profile,
 )
+from tests.unit.conftest import PROFILE_CREDS_PATH
 
-PROFILE_CONFIG = Path(
-    os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "test_profile", "config.yaml"
-    )
-)
+HERE = Path(__file__).resolve().parent
+PROFILE_CONFIG = HERE / "test_profile" / "config.yaml"
 
-PROFILE_CREDS = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)), "test_profile", "credentials.yaml"
-)
+
+@pytest.fixture(scope="module", autouse=True)
+def cached_profile_config(module_mocker):
+    """Parse the test config once and serve it to every profile lookup."""
+    config = _load_config_file(PROFILE_CONFIG)
+    module_mocker.patch(
+        "dataall_core.profile._load_config_file",
+        side_effect=lambda path: (
+            config if Path(path) == PROFILE_CONFIG else _load_config_file(path)
+        ),
+    )
+    yield config
 
 
 @pytest.fixture(autouse=True)
 def cleanup_creds():
     yield
-    if os.path.exists(PROFILE_CREDS):
-        os.remove(PROFILE_CREDS)
+    PROFILE_CREDS_PATH.unlink(missing_ok=True)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def aws_credentials():
     """Mocked AWS Credentials for moto."""
     os.environ["AWS_ACCESS_KEY_ID"] = "testing"
@@ -51,7 +60,8 @@ def aws_credentials():
 
 @pytest.fixture(scope="function")
 def secret_profile_name():
-    return "SecretName"
+    # Unique per test, secrets are not deleted from the module-scoped mock
+    return f"SecretName-{uuid.uuid4().hex}"
 
 
 @pytest.fixture(scope="function")
@@ -59,8 +69,11 @@ def secret_profile_arn(secret_profile_name):
     return f"arn:aws:secretsmanager:us-east-1:11111111111:secret:{secret_profile_name}-XXXXXX"
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def aws_secretsmanager(aws_credentials):
+    moto = pytest.importorskip("moto")
+    import boto3
+
     with moto.mock_aws():
         yield boto3.client("secretsmanager", region_name="us-east-1")
 
@@ -73,10 +86,25 @@ def base_profile_params():
         "client_id": "client_id",
         "redirect_uri": "XXXXXXXXXXXXXXXX",
         "idp_domain_url": "XXXXXXXXXXXXXXXX",
-        "creds_path": PROFILE_CREDS,
+        "creds_path": str(PROFILE_CREDS_PATH),
     }
 
 
+@pytest.fixture(scope="module")
+def base_profile(base_profile_params):
+    return Profile(**base_profile_params)
+
+
+@pytest.fixture(scope="module")
+def base_custom_profile(base_profile_params, custom_profile_params):
+    return Profile(**base_profile_params, **custom_profile_params)
+
+
+@pytest.fixture(scope="module")
+def config_profile(cached_profile_config):
+    return get_profile(profile="CognitoDefault", config_path=PROFILE_CONFIG)
+
+
 @pytest.fixture(scope="module")
 def base_profile_params_missing():
     return {"profile_name": "default"}
@@ -90,25 +118,33 @@ def custom_profile_params():
     }
 
 
-@pytest.fixture
-def create_secret(aws_secretsmanager, secret_profile_name, base_profile_params):
-    final_params = {**base_profile_params}
+def _secret_string(profile_params):
+    final_params = {**profile_params, "username": "username", "password": "password"}
     del final_params["profile_name"]
-    final_params.update({"username": "username", "password": "password"})
-    boto3.client("secretsmanager").create_secret(
-        Name=secret_profile_name, SecretString=json.dumps(final_params)
+    return json.dumps(final_params)
+
+
+@pytest.fixture(scope="module")
+def secret_string(base_profile_params):
+    return _secret_string(base_profile_params)
+
+
+@pytest.fixture(scope="module")
+def secret_string_custom(base_profile_params, custom_profile_params):
+    return _secret_string({**base_profile_params, **custom_profile_params})
+
+
+@pytest.fixture
+def create_secret(aws_secretsmanager, secret_profile_name, secret_string):
+    aws_secretsmanager.create_secret(
+        Name=secret_profile_name, SecretString=secret_string
     )
 
 
 @pytest.fixture
-def create_secret_custom(
-    aws_secretsmanager, secret_profile_name, base_profile_params, custom_profile_params
-):
-    final_params = {**base_profile_params, **custom_profile_params}
-    del final_params["profile_name"]
-    final_params.update({"username": "username", "password": "password"})
-    boto3.client("secretsmanager").create_secret(
-        Name=secret_profile_name, SecretString=json.dumps(final_params)
+def create_secret_custom(aws_secretsmanager, secret_profile_name, secret_string_custom):
+    aws_secretsmanager.create_secret(
+        Name=secret_profile_name, SecretString=secret_string_custom
     )
 
 
@@ -124,14 +160,13 @@ def test_profile_missing_cognito(base_profile_params_missing):
         Profile(**base_profile_params_missing)
 
 
-def test_profile_cognito(base_profile_params):
+def test_profile_cognito(base_profile, base_profile_params):
     """Test if Profile() parameters are missing assert exception raised"""
-    profile = Profile(**base_profile_params)
-    assert profile
+    assert base_profile
     for k, v in base_profile_params.items():
-        assert getattr(profile, k) == v
-    assert profile.auth_type == AuthType.Cognito.value
-    assert profile.config_type == ConfigType.LOCAL.value
+        assert getattr(base_profile, k) == v
+    assert base_profile.auth_type == AuthType.Cognito.value
+    assert base_profile.config_type == ConfigType.LOCAL.value
 
 
 def test_profile_config_type_value_error(base_profile_params):
@@ -152,38 +187,74 @@ def test_profile_missing_custom(base_profile_params):
         Profile(**base_profile_params, auth_type=AuthType.Custom.value)
 
 
-def test_profile_custom(base_profile_params, custom_profile_params):
-    profile = Profile(**base_profile_params, **custom_profile_params)
-    assert profile
+def test_profile_custom(
+    base_custom_profile, base_profile_params, custom_profile_params
+):
+    assert base_custom_profile
     for k, v in base_profile_params.items():
-        assert getattr(profile, k) == v
+        assert getattr(base_custom_profile, k) == v
     for k, v in custom_profile_params.items():
-        assert getattr(profile, k) == v
+        assert getattr(base_custom_profile, k) == v
+
+
+def test_save_credentials_round_trip(tmp_path, base_profile_params):
+    creds_path = tmp_path / "credentials.yaml"
+    creds = {
+        f"profile{i}": {
+            "token": f"profile{i}-token",
+            "expires_at": "2030-01-01T00:00:00",
+            "refresh_token": f"profile{i}-refresh",
+        }
+        for i in range(500)
+    }
+    creds_path.write_text(json.dumps(creds))
 
+    for profile_name in ["profile0", "profile250", "profile499"]:
+        profile = Profile(
+            **{
+                **base_profile_params,
+                "profile_name": profile_name,
+                "creds_path": str(creds_path),
+            }
+        )
+        assert profile.credentials == ProfileCreds(**creds[profile_name])
 
-def test_get_profile_config_yaml_dne(mocker):
-    mocker.patch("os.path.isfile", return_value=False)
-    config = get_profile_config_yaml("default", PROFILE_CONFIG)
-    assert config is None
+        profile.credentials.token = f"{profile_name}-new-token"
+        creds[profile_name]["token"] = f"{profile_name}-new-token"
+        profile.save_credentials()
 
+    assert json.loads(creds_path.read_text()) == creds
 
-def test_get_profile_config_yaml():
-    config = get_profile_config_yaml("CognitoDefault", PROFILE_CONFIG)
-    assert config
-    assert len(config) == 8
 
+def test_get_credentials_legacy_yaml(tmp_path, base_profile_params):
+    creds_path = tmp_path / "credentials.yaml"
+    creds = {"token": "token", "expires_at": None, "refresh_token": "refresh"}
+    creds_path.write_text(yaml.dump({"default": creds}))
 
-def test_get_profile_config_yaml_custom():
-    config = get_profile_config_yaml("CustomDefault", PROFILE_CONFIG)
-    assert config
-    assert len(config) == 7
+    profile = Profile(**{**base_profile_params, "creds_path": str(creds_path)})
+    assert profile.credentials == ProfileCreds(**creds)
+
+    profile.save_credentials()
+    assert json.loads(creds_path.read_text()) == {"default": creds}
 
 
-def test_get_profile_config_yaml_profile_dne():
-    config = get_profile_config_yaml("ProfileDNE", PROFILE_CONFIG)
+def test_get_profile_config_yaml_dne(tmp_path):
+    config = get_profile_config_yaml("default", tmp_path / "config.yaml")
     assert config is None
 
 
+@pytest.mark.parametrize(
+    "profile,expected_len",
+    [("CognitoDefault", 8), ("CustomDefault", 7), ("ProfileDNE", None)],
+)
+def test_get_profile_config_yaml(profile, expected_len):
+    config = get_profile_config_yaml(profile, PROFILE_CONFIG)
+    if expected_len is None:
+        assert config is None
+    else:
+        assert len(config) == expected_len
+
+
 def test_get_profile_secret_value_dne():
     with pytest.raises(MissingParameterSecretException):
         get_profile_secret_value("i-do-not-exist")
@@ -201,19 +272,16 @@ def test_get_profile_secret_value_custom(create_secret_custom, secret_profile_ar
     assert len(config) == 9
 
 
-def test_get_profile_dne():
-    profile = get_profile(profile="doesNotExist")
-    assert profile is None
-
-
-def test_get_profile():
-    profile = get_profile(profile="CognitoDefault", config_path=PROFILE_CONFIG)
-    assert isinstance(profile, Profile)
-
-
-def test_get_profile_custom():
-    profile = get_profile(profile="CustomDefault", config_path=PROFILE_CONFIG)
-    assert isinstance(profile, Profile)
+@pytest.mark.parametrize(
+    "profile_name,exists",
+    [("CognitoDefault", True), ("CustomDefault", True), ("doesNotExist", False)],
+)
+def test_get_profile(profile_name, exists):
+    profile = get_profile(profile=profile_name, config_path=PROFILE_CONFIG)
+    if exists:
+        assert isinstance(profile, Profile)
+    else:
+        assert profile is None
 
 
 def test_get_profile_secret(create_secret, secret_profile_arn):
@@ -222,13 +290,13 @@ def test_get_profile_secret(create_secret, secret_profile_arn):
     assert profile.config_type == ConfigType.SECRET.value
 
 
-def test_save_profile():
-    profile_name = "CognitoDefault"
-    profile = get_profile(profile=profile_name, config_path=PROFILE_CONFIG)
-    assert profile
+def test_save_profile(config_profile):
+    profile_name = config_profile.profile_name
+    # Copy the shared profile so mutating it does not leak into other tests
+    profile = deepcopy(config_profile)
 
-    profile.creds_path = PROFILE_CREDS
-    profile_params = profile.__dict__
+    profile.creds_path = str(PROFILE_CREDS_PATH)
+    profile_params = deepcopy(profile.__dict__)
 
     with tempfile.NamedTemporaryFile() as output_file:
         output_profile = Path(output_file.name)